@@ -11,16 +11,10 @@ from fastapi.responses import RedirectResponse
 import os
 from pathlib import Path
 
-app = FastAPI(title="Mergington High School API",
-              description="API for viewing and signing up for extracurricular activities")
-
-# Mount the static files directory
 current_dir = Path(__file__).parent
-app.mount("/static", StaticFiles(directory=os.path.join(Path(__file__).parent,
-          "static")), name="static")
 
-# In-memory activity database
-activities = {
+# Initial state of the in-memory activity database
+INITIAL_ACTIVITIES = {
     "Chess Club": {
         "description": "Learn strategies and compete in chess tournaments",
         "schedule": "Fridays, 3:30 PM - 5:00 PM",
@@ -78,46 +72,74 @@ activities = {
 }
 
 
-@app.get("/")
-def root():
-    return RedirectResponse(url="/static/index.html")
-
-
-@app.get("/activities")
-def get_activities():
-    return activities
-
-
-@app.post("/activities/{activity_name}/signup")
-def signup_for_activity(activity_name: str, email: str):
-    """Sign up a student for an activity"""
-    # Validate activity exists
-    if activity_name not in activities:
-        raise HTTPException(status_code=404, detail="Activity not found")
-
-    # Get the specific activity
-    activity = activities[activity_name]
-
-    # Add student
-    # Validate student is not already signed up
-    if email in activity["participants"]:
-        raise HTTPException(status_code=400, detail=f"Student {email} is already signed up for {activity_name}")
-    activity["participants"].append(email)
-    return {"message": f"Signed up {email} for {activity_name}"}
-
-
-@app.post("/activities/{activity_name}/unregister")
-def unregister_from_activity(activity_name: str, email: str):
-    """Unregister a student from an activity"""
-    # Validate activity exists
-    if activity_name not in activities:
-        raise HTTPException(status_code=404, detail="Activity not found")
+def build_activities():
+    """Build a fresh activity database from INITIAL_ACTIVITIES"""
+    # Participants are kept as insertion-ordered dict keys for O(1) lookups
+    return {
+        name: {**details, "participants": dict.fromkeys(details["participants"])}
+        for name, details in INITIAL_ACTIVITIES.items()
+    }
 
-    # Get the specific activity
-    activity = activities[activity_name]
 
-    # Remove student
-    if email not in activity["participants"]:
-        raise HTTPException(status_code=400, detail=f"Student {email} is not signed up for {activity_name}")
-    activity["participants"].remove(email)
-    return {"message": f"Unregistered {email} from {activity_name}"}
+def create_app():
+    """Create the FastAPI app together with its own in-memory activity database"""
+    app = FastAPI(title="Mergington High School API",
+                  description="API for viewing and signing up for extracurricular activities")
+
+    # Mount the static files directory
+    app.mount("/static", StaticFiles(directory=os.path.join(current_dir,
+              "static")), name="static")
+
+    # In-memory activity database
+    activities = build_activities()
+
+    @app.get("/")
+    def root():
+        return RedirectResponse(url="/static/index.html")
+
+    @app.get("/activities")
+    def get_activities():
+        # Participants are stored as insertion-ordered dict keys; serialize
+        # them as lists in signup order
+        return {
+            name: {**details, "participants": list(details["participants"])}
+            for name, details in activities.items()
+        }
+
+    @app.post("/activities/{activity_name}/signup")
+    def signup_for_activity(activity_name: str, email: str):
+        """Sign up a student for an activity"""
+        # Validate activity exists
+        if activity_name not in activities:
+            raise HTTPException(status_code=404, detail="Activity not found")
+
+        # Get the specific activity
+        activity = activities[activity_name]
+
+        # Add student
+        # Validate student is not already signed up
+        if email in activity["participants"]:
+            raise HTTPException(status_code=400, detail=f"Student {email} is already signed up for {activity_name}")
+        activity["participants"][email] = None
+        return {"message": f"Signed up {email} for {activity_name}"}
+
+    @app.post("/activities/{activity_name}/unregister")
+    def unregister_from_activity(activity_name: str, email: str):
+        """Unregister a student from an activity"""
+        # Validate activity exists
+        if activity_name not in activities:
+            raise HTTPException(status_code=404, detail="Activity not found")
+
+        # Get the specific activity
+        activity = activities[activity_name]
+
+        # Remove student
+        if email not in activity["participants"]:
+            raise HTTPException(status_code=400, detail=f"Student {email} is not signed up for {activity_name}")
+        del activity["participants"][email]
+        return {"message": f"Unregistered {email} from {activity_name}"}
+
+    return app, activities
+
+
+app, activities = create_app()
@@ -0,0 +1,36 @@
+"""
+Shared fixtures for the Mergington High School Activities API tests
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from src.app import build_activities, create_app
+
+
+@pytest.fixture(scope="session")
+def app_and_state():
+    """Create an app with its own activity database (one per xdist worker)"""
+    return create_app()
+
+
+@pytest.fixture(scope="session")
+def activities(app_and_state):
+    """The in-memory activity database backing the session's app"""
+    return app_and_state[1]
+
+
+@pytest.fixture(scope="session")
+def client(app_and_state):
+    """Create a single test client for the FastAPI app, shared across the session"""
+    # Entering the client runs the app's lifespan startup once for the session
+    with TestClient(app_and_state[0]) as client:
+        yield client
+
+
+@pytest.fixture
+def reset_activities(activities):
+    """Reset activities to initial state after each test"""
+    yield
+
+    # Reset to initial state after test, overwriting the existing keys in place
+    activities.update(build_activities())
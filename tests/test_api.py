@@ -2,89 +2,32 @@
 Tests for the Mergington High School Activities API
 """
 
+from urllib.parse import quote
+
 import pytest
-from fastapi.testclient import TestClient
-from src.app import app, activities
+from src.app import INITIAL_ACTIVITIES
 
 
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI app"""
-    return TestClient(app)
+# Fields every activity returned by GET /activities must have
+_REQUIRED_ACTIVITY_FIELDS = frozenset(
+    {"description", "schedule", "max_participants", "participants"}
+)
 
 
-@pytest.fixture
-def reset_activities():
-    """Reset activities to initial state before each test"""
-    # Save initial state
-    initial_activities = {
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-        },
-        "Basketball": {
-            "description": "Competitive basketball team and practice",
-            "schedule": "Mondays and Wednesdays, 4:00 PM - 5:30 PM",
-            "max_participants": 15,
-            "participants": ["alex@mergington.edu"]
-        },
-        "Soccer": {
-            "description": "Soccer team for all skill levels",
-            "schedule": "Tuesdays and Thursdays, 4:00 PM - 5:30 PM",
-            "max_participants": 22,
-            "participants": ["james@mergington.edu"]
-        },
-        "Art Club": {
-            "description": "Explore painting, drawing, and sculpture",
-            "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 16,
-            "participants": ["isabella@mergington.edu"]
-        },
-        "Drama Club": {
-            "description": "Act in school plays and theatrical productions",
-            "schedule": "Mondays and Thursdays, 4:00 PM - 5:30 PM",
-            "max_participants": 20,
-            "participants": ["gabriel@mergington.edu"]
-        },
-        "Debate Team": {
-            "description": "Develop argumentation and public speaking skills",
-            "schedule": "Tuesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 18,
-            "participants": ["lucas@mergington.edu"]
-        },
-        "Math Club": {
-            "description": "Solve challenging math problems and compete in competitions",
-            "schedule": "Fridays, 3:30 PM - 4:30 PM",
-            "max_participants": 14,
-            "participants": ["sophia@mergington.edu"]
-        }
-    }
-    
-    yield
-    
-    # Reset to initial state after test
-    activities.clear()
-    activities.update(initial_activities)
+def _signup_url(activity, email):
+    """Build the signup URL for an activity, quoting the path and query"""
+    return f"/activities/{quote(activity)}/signup?email={quote(email)}"
+
+
+def _unregister_url(activity, email):
+    """Build the unregister URL for an activity, quoting the path and query"""
+    return f"/activities/{quote(activity)}/unregister?email={quote(email)}"
 
 
 class TestGetActivities:
-    """Tests for the GET /activities endpoint"""
+    """Tests for the GET /activities endpoint (read-only, no reset needed)"""
     
-    def test_get_activities_returns_all_activities(self, client, reset_activities):
+    def test_get_activities_returns_all_activities(self, client):
         """Test that GET /activities returns all activities"""
         response = client.get("/activities")
         assert response.status_code == 200
@@ -96,18 +39,15 @@ class TestGetActivities:
         assert "Programming Class" in data
         assert "Gym Class" in data
         
-    def test_get_activities_contains_activity_details(self, client, reset_activities):
+    def test_get_activities_contains_activity_details(self, client):
         """Test that each activity has required fields"""
         response = client.get("/activities")
         data = response.json()
         
-        for activity_name, activity_info in data.items():
-            assert "description" in activity_info
-            assert "schedule" in activity_info
-            assert "max_participants" in activity_info
-            assert "participants" in activity_info
+        for activity_info in data.values():
+            assert _REQUIRED_ACTIVITY_FIELDS <= activity_info.keys()
     
-    def test_get_activities_chess_club_has_participants(self, client, reset_activities):
+    def test_get_activities_chess_club_has_participants(self, client):
         """Test that Chess Club has the expected participants"""
         response = client.get("/activities")
         data = response.json()
@@ -121,11 +61,9 @@ class TestGetActivities:
 class TestSignup:
     """Tests for the POST /activities/{activity_name}/signup endpoint"""
     
-    def test_signup_new_participant(self, client, reset_activities):
+    def test_signup_new_participant(self, client, activities, reset_activities):
         """Test signing up a new participant for an activity"""
-        response = client.post(
-            "/activities/Chess Club/signup?email=newstudent@mergington.edu"
-        )
+        response = client.post(_signup_url("Chess Club", "newstudent@mergington.edu"))
         
         assert response.status_code == 200
         data = response.json()
@@ -136,57 +74,51 @@ class TestSignup:
         # Verify participant was added
         assert "newstudent@mergington.edu" in activities["Chess Club"]["participants"]
     
-    def test_signup_duplicate_participant(self, client, reset_activities):
-        """Test that signing up a duplicate participant returns 400 error"""
-        response = client.post(
-            "/activities/Chess Club/signup?email=michael@mergington.edu"
-        )
-        
-        assert response.status_code == 400
-        data = response.json()
-        assert "detail" in data
-        assert "already signed up" in data["detail"]
-    
-    def test_signup_nonexistent_activity(self, client, reset_activities):
-        """Test that signing up for a non-existent activity returns 404"""
-        response = client.post(
-            "/activities/Nonexistent Activity/signup?email=student@mergington.edu"
-        )
-        
-        assert response.status_code == 404
-        data = response.json()
-        assert "detail" in data
-        assert "Activity not found" in data["detail"]
-    
-    def test_signup_multiple_activities(self, client, reset_activities):
+    def test_signup_multiple_activities(self, client, activities, reset_activities):
         """Test that a student can sign up for multiple activities"""
         email = "versatile@mergington.edu"
         
         # Sign up for Chess Club
-        response1 = client.post(
-            f"/activities/Chess Club/signup?email={email}"
-        )
+        response1 = client.post(_signup_url("Chess Club", email))
         assert response1.status_code == 200
         
         # Sign up for Programming Class
-        response2 = client.post(
-            f"/activities/Programming Class/signup?email={email}"
-        )
+        response2 = client.post(_signup_url("Programming Class", email))
         assert response2.status_code == 200
         
         # Verify added to both
         assert email in activities["Chess Club"]["participants"]
         assert email in activities["Programming Class"]["participants"]
+    
+    def test_signup_listed_in_signup_order(self, client, reset_activities):
+        """Test that GET /activities lists participants as a list in signup order"""
+        response = client.post(_signup_url("Chess Club", "aaron@mergington.edu"))
+        assert response.status_code == 200
+        
+        response = client.get("/activities")
+        data = response.json()
+        assert data["Chess Club"]["participants"] == [
+            "michael@mergington.edu",
+            "daniel@mergington.edu",
+            "aaron@mergington.edu",
+        ]
+    
+    @pytest.mark.parametrize("activity", list(INITIAL_ACTIVITIES))
+    def test_signup_each_activity(self, client, activities, reset_activities, activity):
+        """Test that a new participant can sign up for every activity"""
+        email = "new@mergington.edu"
+        response = client.post(_signup_url(activity, email))
+        
+        assert response.status_code == 200
+        assert email in activities[activity]["participants"]
 
 
 class TestUnregister:
     """Tests for the POST /activities/{activity_name}/unregister endpoint"""
     
-    def test_unregister_existing_participant(self, client, reset_activities):
+    def test_unregister_existing_participant(self, client, activities, reset_activities):
         """Test unregistering an existing participant"""
-        response = client.post(
-            "/activities/Chess Club/unregister?email=michael@mergington.edu"
-        )
+        response = client.post(_unregister_url("Chess Club", "michael@mergington.edu"))
         
         assert response.status_code == 200
         data = response.json()
@@ -196,76 +128,71 @@ class TestUnregister:
         # Verify participant was removed
         assert "michael@mergington.edu" not in activities["Chess Club"]["participants"]
     
-    def test_unregister_nonparticipant(self, client, reset_activities):
-        """Test unregistering a student who is not signed up returns 400"""
-        response = client.post(
-            "/activities/Chess Club/unregister?email=notstudent@mergington.edu"
-        )
-        
-        assert response.status_code == 400
-        data = response.json()
-        assert "detail" in data
-        assert "not signed up" in data["detail"]
-    
-    def test_unregister_from_nonexistent_activity(self, client, reset_activities):
-        """Test unregistering from a non-existent activity returns 404"""
-        response = client.post(
-            "/activities/Nonexistent Activity/unregister?email=student@mergington.edu"
-        )
-        
-        assert response.status_code == 404
-        data = response.json()
-        assert "detail" in data
-        assert "Activity not found" in data["detail"]
-    
-    def test_unregister_then_signup_again(self, client, reset_activities):
+    def test_unregister_then_signup_again(self, client, activities, reset_activities):
         """Test that a participant can unregister and sign up again"""
         email = "michael@mergington.edu"
         activity = "Chess Club"
         
         # Unregister
-        response1 = client.post(
-            f"/activities/{activity}/unregister?email={email}"
-        )
+        response1 = client.post(_unregister_url(activity, email))
         assert response1.status_code == 200
         assert email not in activities[activity]["participants"]
         
         # Sign up again
-        response2 = client.post(
-            f"/activities/{activity}/signup?email={email}"
-        )
+        response2 = client.post(_signup_url(activity, email))
         assert response2.status_code == 200
         assert email in activities[activity]["participants"]
 
 
+class TestErrorPaths:
+    """Tests for error responses from the signup and unregister endpoints"""
+    
+    @pytest.mark.parametrize("path, status_code, detail", [
+        (_signup_url("Nonexistent Activity", "student@mergington.edu"),
+         404, "Activity not found"),
+        (_unregister_url("Nonexistent Activity", "student@mergington.edu"),
+         404, "Activity not found"),
+        (_signup_url("Chess Club", "michael@mergington.edu"),
+         400, "already signed up"),
+        (_unregister_url("Chess Club", "notstudent@mergington.edu"),
+         400, "not signed up"),
+    ])
+    def test_error_response(self, client, reset_activities, path, status_code, detail):
+        """Test that invalid requests return the expected status and detail"""
+        response = client.post(path)
+        
+        assert response.status_code == status_code
+        data = response.json()
+        assert "detail" in data
+        assert detail in data["detail"]
+
+
 class TestIntegration:
     """Integration tests for workflow scenarios"""
     
-    def test_full_signup_and_unregister_workflow(self, client, reset_activities):
+    @pytest.mark.slow
+    def test_full_signup_and_unregister_workflow(self, client, activities, reset_activities):
         """Test a complete signup and unregister workflow"""
         email = "workflow@mergington.edu"
         activity = "Drama Club"
+        get, post = client.get, client.post
         
         # Initially not signed up
-        response = client.get("/activities")
-        assert email not in response.json()[activity]["participants"]
+        assert email not in activities[activity]["participants"]
         
         # Sign up
-        response = client.post(
-            f"/activities/{activity}/signup?email={email}"
-        )
+        response = post(_signup_url(activity, email))
         assert response.status_code == 200
         
         # Verify signed up
-        response = client.get("/activities")
-        assert email in response.json()[activity]["participants"]
+        response = get("/activities")
+        assert response.status_code == 200
+        data = response.json()
+        assert email in data[activity]["participants"]
         
         # Unregister
-        response = client.post(
-            f"/activities/{activity}/unregister?email={email}"
-        )
+        response = post(_unregister_url(activity, email))
         assert response.status_code == 200
         
         # Verify unregistered
-        response = client.get("/activities")
-        assert email not in response.json()[activity]["participants"]
+        assert email not in activities[activity]["participants"]